@@ -55,15 +55,15 @@ async def get_dashboard_overview(
         
         total_data_points = 0
         for metric_data in metrics_data:
-            if not metric_data.values:
+            if len(metric_data.values) == 0:
                 continue
             values = metric_data.values
             total_data_points += len(values)
             overview["metrics"][metric_data.metric_type.value] = {
-                "current": round(values[-1], 2) if values else 0,
-                "average": round(sum(values) / len(values), 2) if values else 0,
-                "max": round(max(values), 2) if values else 0,
-                "min": round(min(values), 2) if values else 0,
+                "current": round(float(values[-1]), 2),
+                "average": round(float(sum(values)) / len(values), 2),
+                "max": round(float(max(values)), 2),
+                "min": round(float(min(values)), 2),
                 "unit": metric_data.unit
             }
         
@@ -202,9 +202,9 @@ async def get_trends_analysis(
                 "direction": trend_direction,
                 "strength": trend_strength,
                 "slope": float(slope),
-                "start_value": values[0],
-                "end_value": values[-1],
-                "change_percent": ((values[-1] - values[0]) / values[0] * 100) if values[0] != 0 else 0,
+                "start_value": float(values[0]),
+                "end_value": float(values[-1]),
+                "change_percent": float((values[-1] - values[0]) / values[0] * 100) if values[0] != 0 else 0,
                 "unit": metric_data.unit
             }
         
@@ -237,16 +237,16 @@ async def get_performance_summary(
         performance_summary = {}
         
         for metric_data in metrics_data:
-            if not metric_data.values:
+            if len(metric_data.values) == 0:
                 continue
-                
+
             values = metric_data.values
             metric_type = metric_data.metric_type
-            
+
             # Calculate performance indicators
-            avg_value = sum(values) / len(values)
-            max_value = max(values)
-            min_value = min(values)
+            avg_value = float(sum(values)) / len(values)
+            max_value = float(max(values))
+            min_value = float(min(values))
             
             # Determine performance rating
             if metric_type in [MetricType.CPU_TEMP, MetricType.GPU_TEMP]:
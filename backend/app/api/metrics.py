@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from datetime import datetime, timedelta
 from app.models.hardware_models import (
@@ -42,12 +43,27 @@ async def get_time_series_data(
         
         # Calculate total records
         total_records = sum(len(ts_data.values) for ts_data in data)
-        
-        return MetricsResponse(
-            data=data,
-            time_range=TimeRange.CUSTOM,
-            total_records=total_records
-        )
+
+        # Same shape as MetricsResponse, but handed to orjson with the
+        # numpy arrays intact: OPT_SERIALIZE_NUMPY walks the float32 and
+        # datetime64 buffers in C instead of boxing every value through
+        # tolist(). The timestamps must go through the datetime64 array:
+        # the extractor's lists hold pandas Timestamps, which orjson
+        # rejects as an unknown datetime subclass.
+        return ORJSONResponse({
+            "data": [
+                {
+                    "timestamps": ts_data.timestamps_array,
+                    "values": ts_data.values,
+                    "metric_type": ts_data.metric_type,
+                    "component": ts_data.component,
+                    "unit": ts_data.unit,
+                }
+                for ts_data in data
+            ],
+            "time_range": TimeRange.CUSTOM,
+            "total_records": total_records,
+        })
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid date format: {str(e)}")
@@ -117,13 +133,13 @@ async def get_quick_overview(
         # Calculate quick stats
         overview = {}
         for metric_data in data:
-            if metric_data.values:
+            if len(metric_data.values) > 0:
                 values = metric_data.values
                 overview[metric_data.metric_type.value] = {
-                    "current": values[-1] if values else None,
-                    "average": sum(values) / len(values) if values else None,
-                    "max": max(values) if values else None,
-                    "min": min(values) if values else None,
+                    "current": float(values[-1]),
+                    "average": float(sum(values)) / len(values),
+                    "max": float(max(values)),
+                    "min": float(min(values)),
                     "unit": metric_data.unit
                 }
         
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
+import numpy as np
 
 class MetricType(str, Enum):
     CPU_TEMP = "cpu_temperature"
@@ -27,12 +29,34 @@ class HardwareMetric(BaseModel):
     component: str
 
 class TimeSeriesData(BaseModel):
+    """Time series container storing values as a float32 numpy array.
+
+    Values are converted to a numpy array once at ingest so downstream
+    numeric code can operate on them directly without re-wrapping Python
+    lists at every call site.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     timestamps: List[datetime]
-    values: List[float]
+    values: np.ndarray
     metric_type: MetricType
     component: str
     unit: str
 
+    @field_validator('values', mode='before')
+    @classmethod
+    def _coerce_values(cls, v):
+        return np.asarray(v, dtype=np.float32)
+
+    @field_serializer('values')
+    def _serialize_values(self, values: np.ndarray):
+        return values.tolist()
+
+    @cached_property
+    def timestamps_array(self) -> np.ndarray:
+        """Timestamps as a datetime64[ns] array for vectorized filtering"""
+        return np.asarray(self.timestamps, dtype='datetime64[ns]')
+
 class InsightLevel(str, Enum):
     INFO = "info"
     WARNING = "warning"
@@ -46,6 +70,9 @@ class AnomalyEvent(BaseModel):
     severity: str  # 'minor', 'moderate', 'severe'
     description: str
     expected_range: tuple[float, float]
+    # Position in the analyzed series, so removal can target the exact
+    # sample instead of matching by value
+    index: Optional[int] = None
 
 class HardwareInsight(BaseModel):
     id: str
@@ -99,4 +126,5 @@ class AnomalyDetectionConfig(BaseModel):
     iqr_multiplier: float = 1.5     # IQR multiplier for outlier detection
     min_data_points: int = 10       # Minimum points needed for analysis
     rolling_window_size: int = 20   # Window size for rolling statistics
+    streaming: bool = False         # Sliding-window IQR instead of whole-series percentiles
     trend_sensitivity: float = 0.1  # Sensitivity for trend detection
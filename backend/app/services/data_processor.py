@@ -1,94 +1,255 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as papq
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-import glob
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime
 import logging
+import mmap
+import os
+import re
+import threading
 from app.models.hardware_models import MetricType, TimeSeriesData, HardwareMetric
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Open Hardware Monitor timestamp layout; passing it explicitly keeps
+# pd.to_datetime on the vectorized C parser instead of per-row inference
+_TIME_FORMAT = "%m/%d/%Y %H:%M:%S"
+
+# Processed frames kept hot in memory per DataProcessor instance
+_CACHE_MAX_ENTRIES = 8
+
+# Log filenames carrying a date, with or without the OHM prefix
+_DATE_RE = re.compile(r'(?:OpenHardwareMonitorLog-)?(\d{4}-\d{2}-\d{2})\.csv$')
+
+# Candidate columns per metric type (Open Hardware Monitor format),
+# built once; suffixed names cover known duplicate labels
+_METRIC_COLUMNS = {
+    MetricType.CPU_TEMP: ('CPU Total',),  # CPU Total represents overall CPU load/temp
+    MetricType.GPU_TEMP: ('GPU Core', 'GPU Core_1'),
+    MetricType.CPU_USAGE: ('CPU Total',),
+    MetricType.GPU_USAGE: ('GPU Core', 'GPU Core_1'),
+    MetricType.FAN_SPEED: ('GPU Fan',),
+    MetricType.MEMORY_USAGE: ('Memory',),
+    MetricType.DISK_USAGE: ('Used Space', 'Used Space_1'),
+}
+
+# Per-core temperature columns, matched with one precompiled pattern
+_CPU_CORE_RE = re.compile(r'CPU Core #\d+')
+
+_METRIC_UNITS = {
+    MetricType.CPU_TEMP: "°C",
+    MetricType.GPU_TEMP: "°C",
+    MetricType.CPU_USAGE: "%",
+    MetricType.GPU_USAGE: "%",
+    MetricType.FAN_SPEED: "RPM",
+    MetricType.MEMORY_USAGE: "%",
+    MetricType.DISK_USAGE: "%",
+}
+
+def _bucket_reduce(values: np.ndarray, ts_ns: np.ndarray,
+                   n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean-downsample a series into at most n_buckets buckets
+
+    np.add.reduceat performs the whole per-bucket reduction in one
+    vectorized pass; bucket starts are evenly spaced over the sample
+    index and keep their original timestamps.
+    """
+    edges = np.unique(np.linspace(0, len(values), num=n_buckets + 1,
+                                  dtype=np.int64)[:-1])
+    sums = np.add.reduceat(values.astype(np.float64), edges)
+    counts = np.diff(np.append(edges, len(values)))
+    return ts_ns[edges], (sums / counts).astype(np.float32)
+
 class DataProcessor:
     def __init__(self):
         self.data_directory = Path(settings.data_directory)
-        self.cache = {}
+        # Bounded LRU of processed frames; overview and period queries for
+        # the same day share one parse. Keys are (date, source mtime) for
+        # full frames, with the sorted candidate columns appended for
+        # column-pruned Parquet reads
+        self.cache: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Arrow column types per CSV header, built on first sight of a
+        # machine's schema and reused for every later log it produces
+        self._schema_cache: Dict[Tuple[str, ...], Dict[str, pa.DataType]] = {}
+        # Directory listing memo: (directory mtime_ns, sorted dates)
+        self._dates_cache: Optional[Tuple[int, List[str]]] = None
+        # System info memo, valid until a new log lands in the directory
+        self._sysinfo_cache: Optional[Tuple[int, Dict[str, Any]]] = None
         
     def get_available_dates(self) -> List[str]:
-        """Get list of available dates from CSV files"""
-        pattern = self.data_directory / "*.csv"
-        files = glob.glob(str(pattern))
-        dates = []
-        
-        for file in files:
-            try:
+        """Get list of available dates from CSV files
+
+        Scans the directory once per mtime change; between file drops the
+        memoized listing is returned without touching the filesystem.
+        """
+        try:
+            dir_mtime = os.stat(self.data_directory).st_mtime_ns
+        except OSError:
+            return []
+
+        if self._dates_cache is not None and self._dates_cache[0] == dir_mtime:
+            return self._dates_cache[1]
+
+        dates = set()
+        with os.scandir(self.data_directory) as entries:
+            for entry in entries:
                 # Handle OpenHardwareMonitorLog-YYYY-MM-DD.csv format
-                filename = Path(file).stem
-                if filename.startswith("OpenHardwareMonitorLog-"):
-                    date_str = filename.replace("OpenHardwareMonitorLog-", "")
-                else:
-                    date_str = filename
-                    
-                datetime.strptime(date_str, "%Y-%m-%d")
-                dates.append(date_str)
-            except ValueError:
-                continue
-                
-        return sorted(dates)
-    
+                match = _DATE_RE.match(entry.name)
+                if match and entry.is_file():
+                    dates.add(match.group(1))
+
+        result = sorted(dates)
+        self._dates_cache = (dir_mtime, result)
+        return result
+
+    def latest_date(self) -> Optional[str]:
+        """Most recent available date, or None when no logs exist
+
+        Callers that only need the newest log can use this instead of
+        indexing into the full listing; it rides the same memoized scan.
+        """
+        dates = self.get_available_dates()
+        return dates[-1] if dates else None
+
+    def iter_batches(self, date: str):
+        """Stream a log as Arrow record batches of ~chunk_size KiB each
+
+        open_csv parses one block at a time, so peak memory is bounded by
+        the block size rather than the file size, and consumers can stop
+        early (e.g. at max_rows_per_file) without parsing the rest. The
+        file is memory-mapped so the parser reads kernel pages directly
+        instead of going through Python buffered I/O copies.
+        """
+        file_path = self.data_directory / f"OpenHardwareMonitorLog-{date}.csv"
+
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+
+        try:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            header = mm.readline().decode('utf-8', 'replace').rstrip('\r\n').split(',')
+            mm.seek(0)
+
+            # The sensor schema is stable per machine, so the column-type
+            # mapping for a given header is built once and reused: Time
+            # parses directly to millisecond timestamps in Arrow C++
+            # (no per-row Python date parsing), every sensor column
+            # parses straight to float32 with no type inference. Dirty
+            # files (embedded headers from concatenated logs) fail this
+            # typed parse with ArrowInvalid and take the pandas fallback
+            # in load_csv_data.
+            schema_key = tuple(header)
+            column_types = self._schema_cache.get(schema_key)
+            if column_types is None:
+                column_types = {
+                    name: pa.timestamp('ms') if name == 'Time' else pa.float32()
+                    for name in header
+                }
+                self._schema_cache[schema_key] = column_types
+
+            reader = pa.BufferReader(pa.py_buffer(mm))
+            try:
+                with pacsv.open_csv(
+                    reader,
+                    read_options=pacsv.ReadOptions(block_size=settings.chunk_size * 1024),
+                    parse_options=pacsv.ParseOptions(delimiter=','),
+                    convert_options=pacsv.ConvertOptions(
+                        column_types=column_types,
+                        timestamp_parsers=[_TIME_FORMAT],
+                        strings_can_be_null=True,
+                        null_values=['', 'nan', 'NaN', 'NULL']
+                    )
+                ) as stream:
+                    for batch in stream:
+                        yield batch
+            finally:
+                # Drop the Arrow view so the mmap's exported buffer is
+                # released before closing it
+                reader.close()
+                del reader
+        finally:
+            try:
+                mm.close()
+            except BufferError:
+                # Arrow can zero-copy small single-block inputs; the map
+                # is released once those buffers are freed (to_pandas
+                # with self_destruct drops them)
+                pass
+
     def load_csv_data(self, date: str) -> pd.DataFrame:
         """Load CSV data for a specific date"""
         try:
             # Construct file path
             file_path = self.data_directory / f"OpenHardwareMonitorLog-{date}.csv"
-            
-            if not file_path.exists():
+
+            # One stat answers existence and size together
+            try:
+                st = os.stat(file_path)
+            except OSError:
                 print(f"No data for date: {date}")
                 return pd.DataFrame()
-            
-            # Check file size before loading
-            file_size_mb = file_path.stat().st_size / (1024 * 1024)
+
+            file_size_mb = st.st_size / (1024 * 1024)
             if file_size_mb > settings.max_csv_size_mb:
                 print(f"File {file_path} is too large ({file_size_mb:.1f}MB > {settings.max_csv_size_mb}MB). Skipping.")
                 return pd.DataFrame()
             
             print(f"Loading CSV file: {file_path} ({file_size_mb:.1f}MB)")
             
-            # First, try to read with optimized settings
+            # Sensor columns parse straight to float32 against the cached
+            # per-machine schema; the string-typed pandas fallback below
+            # covers files that schema rejects. Streaming block by block
+            # keeps peak memory bounded and stops parsing once the row
+            # limit is reached.
             try:
+                batches = []
+                rows = 0
+                for batch in self.iter_batches(date):
+                    batches.append(batch)
+                    rows += batch.num_rows
+                    if rows >= settings.max_rows_per_file:
+                        print(f"Reached maximum rows limit ({settings.max_rows_per_file})")
+                        break
+
+                if not batches:
+                    print("No data could be loaded")
+                    return pd.DataFrame()
+
+                table = pa.Table.from_batches(batches)
+                # Limit rows to prevent memory issues
+                if table.num_rows > settings.max_rows_per_file:
+                    table = table.slice(0, settings.max_rows_per_file)
+                df = table.to_pandas(split_blocks=True, self_destruct=True)
+                print(f"Successfully loaded CSV with {len(df)} rows and {len(df.columns)} columns")
+            except pa.ArrowInvalid:
+                # Ragged/odd files that Arrow rejects: fall back to the
+                # forgiving pandas C parser
+                print(f"PyArrow could not parse {file_path}, falling back to pandas")
                 df = pd.read_csv(
-                    file_path, 
+                    file_path,
                     header=0,
+                    engine='c',
+                    memory_map=True,
                     low_memory=False,  # Prevent mixed type warnings
                     dtype=str,  # Load all columns as strings first to avoid type inference issues
                     na_values=['', 'nan', 'NaN', 'NULL'],
                     keep_default_na=True,
                     nrows=settings.max_rows_per_file  # Limit rows to prevent memory issues
                 )
-                print(f"Successfully loaded CSV with {len(df)} rows and {len(df.columns)} columns")
-            except MemoryError:
-                print(f"Memory error loading {file_path}, trying chunked loading...")
-                # If memory error, try chunked loading
-                chunk_size = settings.chunk_size
-                chunks = []
-                
-                for chunk in pd.read_csv(file_path, header=0, chunksize=chunk_size, dtype=str):
-                    chunks.append(chunk)
-                    if len(chunks) % 5 == 0:  # Log progress every 50k rows
-                        print(f"Processed {len(chunks) * chunk_size} rows...")
-                    
-                    # Stop if we've reached the maximum rows
-                    if len(chunks) * chunk_size >= settings.max_rows_per_file:
-                        print(f"Reached maximum rows limit ({settings.max_rows_per_file})")
-                        break
-                
-                if chunks:
-                    df = pd.concat(chunks, ignore_index=True)
-                    print(f"Chunked loading completed: {len(df)} rows")
-                else:
-                    print("No data could be loaded")
-                    return pd.DataFrame()
+                print(f"Loaded CSV with pandas fallback: {len(df)} rows")
             
             # Clean up memory
             import gc
@@ -100,6 +261,107 @@ class DataProcessor:
             print(f"Error loading CSV for date {date}: {e}")
             return pd.DataFrame()
     
+    def _cache_store(self, key: Tuple[str, int], df: pd.DataFrame) -> None:
+        """Insert a processed frame into the LRU, evicting the oldest"""
+        with self._cache_lock:
+            self.cache[key] = df
+            self.cache.move_to_end(key)
+            while len(self.cache) > _CACHE_MAX_ENTRIES:
+                self.cache.popitem(last=False)
+
+    def _parquet_path(self, date: str) -> Path:
+        """Path of the Parquet side-cache for a date"""
+        return self.data_directory / f"OpenHardwareMonitorLog-{date}.parquet"
+
+    @staticmethod
+    def _metric_candidate_columns(metric_types: List[MetricType]) -> Tuple[str, ...]:
+        """Column names that extract_metrics may read for these types"""
+        columns = set()
+        for metric_type in metric_types:
+            columns.update(_METRIC_COLUMNS.get(metric_type, ()))
+        return tuple(sorted(columns))
+
+    def _load_processed_data(self, date: str,
+                             metric_types: List[MetricType] = None) -> pd.DataFrame:
+        """Load processed data for a date, preferring the Parquet cache
+
+        The first successful parse of a log is persisted next to the CSV;
+        repeat queries then skip tokenizing and dtype coercion entirely.
+        A stale cache (older than its CSV) is ignored and rewritten. When
+        metric_types is given, a fresh Parquet cache is read with column
+        pushdown: only the pages of the requested sensor columns are
+        decompressed, resolved against the footer schema.
+        """
+        parquet_path = self._parquet_path(date)
+        csv_path = self.data_directory / f"OpenHardwareMonitorLog-{date}.csv"
+
+        # In-memory hit: same date and an unchanged source file. A cached
+        # full frame satisfies any column subset, so it is checked first.
+        try:
+            source_mtime = os.stat(csv_path).st_mtime_ns
+        except OSError:
+            try:
+                source_mtime = os.stat(parquet_path).st_mtime_ns
+            except OSError:
+                source_mtime = 0
+        cache_key = (date, source_mtime)
+        candidates = self._metric_candidate_columns(metric_types) if metric_types else None
+        subset_key = cache_key + candidates if candidates else None
+        with self._cache_lock:
+            for key in (cache_key, subset_key):
+                if key is None:
+                    continue
+                cached = self.cache.get(key)
+                if cached is not None:
+                    self.cache.move_to_end(key)
+                    return cached
+
+        try:
+            if parquet_path.exists() and (
+                not csv_path.exists()
+                or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+            ):
+                columns = None
+                if candidates:
+                    # Resolve candidates (plus per-core temperature
+                    # columns) against the footer schema, which reads no
+                    # data pages
+                    names = papq.read_schema(parquet_path).names
+                    wanted = set(candidates)
+                    match_cores = MetricType.CPU_TEMP in metric_types
+                    columns = [
+                        name for name in names
+                        if name == 'timestamp' or name in wanted
+                        or (match_cores and _CPU_CORE_RE.search(name))
+                    ]
+                # memory_map lets Arrow decode pages straight from kernel
+                # cache instead of copying the file through Python I/O
+                df = pd.read_parquet(parquet_path, engine='pyarrow',
+                                     memory_map=True, columns=columns)
+                self._cache_store(subset_key if columns is not None else cache_key, df)
+                return df
+        except Exception as e:
+            print(f"Error reading Parquet cache for {date}: {e}")
+
+        df = self.load_csv_data(date)
+        if df.empty:
+            return df
+
+        df = self.process_csv_data(df, date)
+        if not df.empty:
+            self._cache_store(cache_key, df)
+            try:
+                df.to_parquet(
+                    parquet_path,
+                    engine='pyarrow',
+                    compression='zstd',
+                    row_group_size=settings.chunk_size
+                )
+            except Exception as e:
+                # Cache write is best-effort (e.g. duplicate column labels)
+                print(f"Could not write Parquet cache for {date}: {e}")
+        return df
+
     def process_csv_data(self, df: pd.DataFrame, date: str) -> pd.DataFrame:
         """Process the loaded CSV data to extract metrics"""
         try:
@@ -125,55 +387,96 @@ class DataProcessor:
             else:
                 print("No 'Time' column found, using first row as header")
             
+            # Fused pipeline: dedupe labels positionally, parse the
+            # timestamp, batch-convert every value column and assemble the
+            # output frame once, instead of mutating df column by column
+            # (each assignment re-consolidates the BlockManager)
+            # Vectorized duplicate detection: Index.duplicated runs in C
+            # instead of a Python loop over (potentially hundreds of)
+            # sensor columns
+            cols = pd.Index(df.columns)
+            dup_after_first = cols.duplicated(keep='first')
+            duplicate_labels = set(cols[dup_after_first])
+
+            arrays = {
+                cols[pos]: df.iloc[:, pos]
+                for pos in np.flatnonzero(~dup_after_first)
+            }
+
             # Convert timestamp column
-            if 'Time' in df.columns:
-                df['timestamp'] = pd.to_datetime(df['Time'], errors='coerce')
-            elif 'time' in df.columns:
-                df['timestamp'] = pd.to_datetime(df['time'], errors='coerce')
-            elif 'timestamp' in df.columns:
-                df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
+            if 'Time' in arrays:
+                if pd.api.types.is_datetime64_any_dtype(arrays['Time']):
+                    # Arrow already parsed the column to timestamps
+                    timestamp = arrays['Time']
+                else:
+                    timestamp = pd.to_datetime(
+                        arrays['Time'], format=_TIME_FORMAT, cache=True, errors='coerce'
+                    )
+                    if len(df) > 0 and timestamp.isna().all():
+                        # Unexpected layout: fall back to format inference
+                        timestamp = pd.to_datetime(arrays['Time'], cache=True, errors='coerce')
+            elif 'time' in arrays:
+                timestamp = pd.to_datetime(arrays['time'], cache=True, errors='coerce')
+            elif 'timestamp' in arrays:
+                timestamp = pd.to_datetime(arrays['timestamp'], cache=True, errors='coerce')
             else:
                 # Create timestamp from index if no time column
-                df['timestamp'] = pd.date_range(
+                timestamp = pd.Series(pd.date_range(
                     start=datetime.strptime(date, "%Y-%m-%d"),
                     periods=len(df),
                     freq='1min'
-                )
-            
+                ))
+
+            # Keep the historical nanosecond resolution regardless of the
+            # unit pandas inferred while parsing
+            out = {'timestamp': timestamp.astype('datetime64[ns]')}
+            if 'Time' in arrays:
+                out['Time'] = arrays['Time']
+
+            # Convert numeric columns (skip timestamp and time columns) in
+            # one batched pass, then downcast: sensor readings fit
+            # comfortably in narrower types, halving the bytes every
+            # downstream aggregation touches
+            value_cols = [c for c in arrays if c not in ('timestamp', 'Time')]
+            converted = pd.DataFrame(
+                {c: arrays[c] for c in value_cols}
+            ).apply(pd.to_numeric, errors='coerce')
+
+            numeric_columns = []
+            for col in value_cols:
+                series = converted[col]
+                if series.isna().all() and arrays[col].notna().any():
+                    # Pure text column (board names, sensor labels):
+                    # keep it, dictionary-encoded when labels repeat,
+                    # instead of an all-NaN numeric column
+                    raw = arrays[col]
+                    if raw.nunique(dropna=False) / max(len(raw), 1) < 0.5:
+                        raw = raw.astype('category')
+                    out[col] = raw
+                    continue
+                if pd.api.types.is_float_dtype(series):
+                    series = pd.to_numeric(series, downcast='float')
+                elif pd.api.types.is_integer_dtype(series):
+                    series = pd.to_numeric(series, downcast='integer')
+                out[col] = series
+                numeric_columns.append(col)
+                if col in duplicate_labels:
+                    # Duplicate labels also get a suffixed alias, the name
+                    # extract_metrics looks up for known duplicates
+                    out[f"{col}_1"] = series
+                    numeric_columns.append(f"{col}_1")
+
+            df = pd.DataFrame(out)
+
             # Remove rows with invalid timestamps
             df = df.dropna(subset=['timestamp'])
             print(f"Rows with valid timestamps: {len(df)}")
-            
-            # Convert numeric columns (skip timestamp and non-numeric columns)
-            numeric_columns = []
-            for col in df.columns:
-                if col != 'timestamp' and col != 'Time':
-                    try:
-                        # Handle duplicate columns (DataFrame) vs single columns (Series)
-                        column_data = df[col]
-                        if isinstance(column_data, pd.DataFrame):
-                            # For duplicate columns, use the first sub-column
-                            column_data = column_data.iloc[:, 0]
-                            # Rename the column to avoid conflicts
-                            new_col_name = f"{col}_1"
-                            df[new_col_name] = column_data
-                            # Try to convert the new column to numeric
-                            df[new_col_name] = pd.to_numeric(df[new_col_name], errors='coerce')
-                            numeric_columns.append(new_col_name)
-                        else:
-                            # Single column, convert directly
-                            df[col] = pd.to_numeric(df[col], errors='coerce')
-                            numeric_columns.append(col)
-                    except Exception as e:
-                        print(f"Could not convert column {col} to numeric: {e}")
-                        continue
-            
             print(f"Converted {len(numeric_columns)} columns to numeric")
-            
+
             # Clean up memory
             import gc
             gc.collect()
-            
+
             return df
             
         except Exception as e:
@@ -189,21 +492,18 @@ class DataProcessor:
             if not available_dates:
                 return []
             
-            # Filter dates in range
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-            
-            # Filter by date range (include the entire end date)
-            end_dt_inclusive = end_dt + timedelta(days=1) - timedelta(seconds=1)
-            
-            dates_in_range = []
-            for date in available_dates:
-                try:
-                    date_dt = datetime.strptime(date, "%Y-%m-%d")
-                    if start_dt <= date_dt <= end_dt_inclusive:
-                        dates_in_range.append(date)
-                except ValueError:
-                    continue
+            # Validate the endpoints up front (raises on bad input)
+            datetime.strptime(start_date, "%Y-%m-%d")
+            datetime.strptime(end_date, "%Y-%m-%d")
+
+            # Filter by date range in one vectorized comparison over epoch
+            # days; day resolution makes the end date inclusive for free.
+            # get_available_dates only returns regex-validated YYYY-MM-DD
+            # strings, so the datetime64 conversion cannot fail
+            dates_np = np.array(available_dates, dtype='datetime64[D]')
+            mask = (dates_np >= np.datetime64(start_date)) & \
+                   (dates_np <= np.datetime64(end_date))
+            dates_in_range = [available_dates[i] for i in np.flatnonzero(mask)]
             
             if not dates_in_range:
                 print(f"No dates found in range {start_date} to {end_date}")
@@ -224,38 +524,44 @@ class DataProcessor:
                     dates_in_range = dates_in_range[::step]
                     print(f"Sampled to {len(dates_in_range)} dates for performance")
             
-            # Process each date and combine data
-            all_data = []
-            for date in dates_in_range:
+            def _load_for_date(date: str) -> Optional[pd.DataFrame]:
                 try:
                     print(f"Processing date: {date}")
-                    
-                    # Load and process CSV data
-                    df = self.load_csv_data(date)
-                    if not df.empty:
-                        df = self.process_csv_data(df, date)
-                        if not df.empty:
-                            # Apply sampling if enabled and dataset is large
-                            if enable_sampling and len(df) > 5000:
-                                sample_size = int(len(df) * settings.sampling_ratio)
-                                df = df.sample(n=sample_size, random_state=42).sort_index()
-                                print(f"Sampled {len(df)} rows from {date}")
-                            
-                            all_data.append(df)
-                            print(f"Successfully processed {date}: {len(df)} rows")
-                        else:
-                            print(f"No valid data after processing for {date}")
-                    else:
-                        print(f"No data loaded for {date}")
-                    
-                    # Clean up memory after each date
-                    import gc
-                    gc.collect()
-                    
+
+                    # Load processed data (Parquet cache with column
+                    # pushdown, or CSV parse)
+                    df = self._load_processed_data(date, metric_types)
+                    if df.empty:
+                        print(f"No data available for {date}")
+                        return None
+
+                    # Apply sampling if enabled and dataset is large
+                    if enable_sampling and len(df) > 5000:
+                        sample_size = int(len(df) * settings.sampling_ratio)
+                        df = df.sample(n=sample_size, random_state=42).sort_index()
+                        print(f"Sampled {len(df)} rows from {date}")
+
+                    print(f"Successfully processed {date}: {len(df)} rows")
+                    return df
                 except Exception as e:
                     print(f"Error processing date {date}: {e}")
-                    continue
-            
+                    return None
+
+            # Per-date work is disk reads plus parser code that releases
+            # the GIL, so dates can be loaded concurrently
+            if len(dates_in_range) > 1:
+                workers = min(len(dates_in_range), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(_load_for_date, dates_in_range))
+            else:
+                results = [_load_for_date(date) for date in dates_in_range]
+
+            all_data = [df for df in results if df is not None]
+
+            # Clean up memory after loading
+            import gc
+            gc.collect()
+
             if not all_data:
                 print("No data could be processed from any dates")
                 return []
@@ -291,32 +597,27 @@ class DataProcessor:
             
             print(f"Extracting metrics from {len(df)} rows")
             
-            # Map metric types to column names (Open Hardware Monitor format)
-            metric_mapping = {
-                MetricType.CPU_TEMP: ['CPU Total'],  # CPU Total represents overall CPU load/temp
-                MetricType.GPU_TEMP: ['GPU Core', 'GPU Core_1'],   # GPU Core temperature (handle duplicates)
-                MetricType.CPU_USAGE: ['CPU Total'], # CPU Total usage percentage
-                MetricType.GPU_USAGE: ['GPU Core', 'GPU Core_1'],  # GPU Core usage (handle duplicates)
-                MetricType.FAN_SPEED: ['GPU Fan'],   # GPU Fan speed
-                MetricType.MEMORY_USAGE: ['Memory'], # Memory usage percentage
-                MetricType.DISK_USAGE: ['Used Space', 'Used Space_1'] # Disk usage (handle duplicates)
-            }
-            
-            # Also try to map individual CPU cores for temperature analysis
-            cpu_core_columns = [col for col in df.columns if 'CPU Core #' in col]
-            if cpu_core_columns:
-                metric_mapping[MetricType.CPU_TEMP].extend(cpu_core_columns)
-            
             results = []
-            
+
             # Use all metric types if none specified
             target_metric_types = metric_types if metric_types else list(MetricType)
-            
+
+            # Membership checks against a set instead of scanning the
+            # Index per candidate column
+            column_set = set(df.columns)
+
+            # Also try to map individual CPU cores for temperature analysis
+            cpu_core_columns = tuple(
+                col for col in df.columns if _CPU_CORE_RE.search(str(col))
+            )
+
             for metric_type in target_metric_types:
-                possible_columns = metric_mapping.get(metric_type, [])
-                
+                possible_columns = _METRIC_COLUMNS.get(metric_type, ())
+                if metric_type is MetricType.CPU_TEMP and cpu_core_columns:
+                    possible_columns = possible_columns + cpu_core_columns
+
                 for col in possible_columns:
-                    if col in df.columns:
+                    if col in column_set:
                         try:
                             # Handle duplicate columns (DataFrame) vs single columns (Series)
                             column_data = df[col]
@@ -334,15 +635,22 @@ class DataProcessor:
                             clean_data = clean_data.dropna()
                             
                             if len(clean_data) > 0:
-                                # Convert values to float, handling any remaining non-numeric values
-                                values = []
-                                for v in clean_data[col].tolist():
-                                    try:
-                                        values.append(float(v))
-                                    except (ValueError, TypeError):
-                                        continue
-                                
-                                if len(values) > 0:
+                                # Hand the column buffer over as float32
+                                # without boxing each value into a Python
+                                # float; the model stores it as-is
+                                values = clean_data[col].to_numpy(dtype=np.float32, copy=False)
+
+                                if len(values) > settings.max_data_points_per_request:
+                                    # Bucket-average oversized series down
+                                    # to the response limit in one
+                                    # vectorized reduction
+                                    ts_ns = clean_data['timestamp'].to_numpy(dtype='datetime64[ns]')
+                                    ts_ns, values = _bucket_reduce(
+                                        values, ts_ns, settings.max_data_points_per_request
+                                    )
+                                    timestamps = pd.to_datetime(ts_ns).tolist()
+                                    print(f"Downsampled {col} to {len(values)} buckets")
+                                else:
                                     # Get corresponding timestamps
                                     timestamps = clean_data['timestamp'].tolist()
                                     # Ensure we have matching timestamps and values
@@ -351,7 +659,8 @@ class DataProcessor:
                                     else:
                                         # If we have more values than timestamps, truncate values
                                         values = values[:len(timestamps)]
-                                    
+
+                                if len(values) > 0:
                                     time_series = TimeSeriesData(
                                         timestamps=timestamps,
                                         values=values,
@@ -376,16 +685,7 @@ class DataProcessor:
     
     def _get_unit_for_metric(self, metric_type: MetricType) -> str:
         """Get the unit for a specific metric type"""
-        units = {
-            MetricType.CPU_TEMP: "°C",
-            MetricType.GPU_TEMP: "°C",
-            MetricType.CPU_USAGE: "%",
-            MetricType.GPU_USAGE: "%",
-            MetricType.FAN_SPEED: "RPM",
-            MetricType.MEMORY_USAGE: "%",
-            MetricType.DISK_USAGE: "%"
-        }
-        return units.get(metric_type, "")
+        return _METRIC_UNITS.get(metric_type, "")
     
     def get_statistics(self, start_date: str, end_date: str, 
                       metric_type: MetricType) -> Dict[str, Any]:
@@ -395,33 +695,54 @@ class DataProcessor:
         if not metrics_data:
             return {}
             
-        # Combine all values
-        all_values = []
-        for data in metrics_data:
-            all_values.extend(data.values)
-            
+        # Combine all values (already numpy arrays on TimeSeriesData)
+        all_values = [data.values for data in metrics_data if data.values.size]
+
         if not all_values:
             return {}
-            
-        values_array = np.array(all_values)
-        
+
+        values_array = np.concatenate(all_values)
+
+        # One percentile call covers median and both quartiles instead of
+        # four separate sorting passes; mean and std come from one
+        # sum/sum-of-squares sweep instead of np.std re-deriving the mean
+        q25, median, q75 = np.percentile(values_array, [25, 50, 75])
+        n = values_array.size
+        total = float(values_array.sum(dtype=np.float64))
+        total_sq = float(np.multiply(values_array, values_array, dtype=np.float64).sum())
+        mean = total / n
+        variance = max(total_sq / n - mean * mean, 0.0)
+
         return {
-            "count": len(values_array),
-            "mean": float(np.mean(values_array)),
-            "median": float(np.median(values_array)),
-            "std": float(np.std(values_array)),
+            "count": n,
+            "mean": mean,
+            "median": float(median),
+            "std": float(np.sqrt(variance)),
             "min": float(np.min(values_array)),
             "max": float(np.max(values_array)),
-            "q25": float(np.percentile(values_array, 25)),
-            "q75": float(np.percentile(values_array, 75)),
-            "iqr": float(np.percentile(values_array, 75) - np.percentile(values_array, 25))
+            "q25": float(q25),
+            "q75": float(q75),
+            "iqr": float(q75 - q25)
         }
     
     def get_system_info(self) -> Dict[str, Any]:
-        """Extract system information from the data"""
+        """Extract system information from the data
+
+        The machine's topology is fixed across its logs, so the computed
+        summary is memoized and only rebuilt when a new file lands in the
+        data directory (detected via its mtime, same as the date listing).
+        """
         try:
+            try:
+                dir_mtime = os.stat(self.data_directory).st_mtime_ns
+            except OSError:
+                return {}
+
+            if self._sysinfo_cache is not None and self._sysinfo_cache[0] == dir_mtime:
+                return self._sysinfo_cache[1]
+
             available_dates = self.get_available_dates()
-            
+
             if not available_dates:
                 return {}
                 
@@ -429,16 +750,11 @@ class DataProcessor:
             latest_date = available_dates[-1]
             print(f"Loading system info from latest date: {latest_date}")
             
-            # Load and process only the latest date for system info
-            df = self.load_csv_data(latest_date)
-            if df.empty:
-                print(f"No data loaded for {latest_date}")
-                return {}
-            
-            # Process the data
-            df = self.process_csv_data(df, latest_date)
+            # Load only the latest date for system info (Parquet cache or
+            # CSV parse)
+            df = self._load_processed_data(latest_date)
             if df.empty:
-                print(f"No valid data after processing for {latest_date}")
+                print(f"No data available for {latest_date}")
                 return {}
             
             print(f"Processing system info from {len(df)} rows")
@@ -508,6 +824,7 @@ class DataProcessor:
             gc.collect()
             
             print(f"System info extracted successfully: {len(system_info)} fields")
+            self._sysinfo_cache = (dir_mtime, system_info)
             return system_info
             
         except Exception as e:
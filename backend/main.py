@@ -1,21 +1,42 @@
+import orjson
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
 from app.api import metrics, insights, dashboard
 from app.core.config import settings
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the data-processor directory scan before serving so the first
+    # dashboard request does not pay the cold-start cost
+    metrics.data_processor.get_available_dates()
+    yield
+
 app = FastAPI(
     title="Open Hardware Monitor Dashboard API",
     description="API for analyzing Open Hardware Monitor data with intelligent insights",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Static payloads serialized once at import time
+_ROOT_BYTES = orjson.dumps({"message": "Open Hardware Monitor Dashboard API", "version": "1.0.0"})
+_HEALTH_OK = b"ok"
+
+# Compress large insight/metric payloads; small responses skip gzip.
+# Middleware added later wraps middleware added earlier, so CORS (below)
+# sits outside gzip and handles preflights before any compression.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 # Include routers
@@ -23,14 +44,26 @@ app.include_router(metrics.router, prefix="/api/v1/metrics", tags=["metrics"])
 app.include_router(insights.router, prefix="/api/v1/insights", tags=["insights"])
 app.include_router(dashboard.router, prefix="/api/v1/dashboard", tags=["dashboard"])
 
-@app.get("/")
+@app.get("/", response_class=Response)
 async def root():
-    return {"message": "Open Hardware Monitor Dashboard API", "version": "1.0.0"}
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
-@app.get("/health")
+@app.get("/health", response_class=PlainTextResponse)
 async def health_check():
-    return {"status": "healthy"}
+    # Liveness probe: plain static bytes, no JSON or response-model pass
+    return PlainTextResponse(content=_HEALTH_OK)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop="auto" picks uvloop where uvicorn[standard] installs it and
+    # falls back to the stdlib loop on Windows (uvloop has no Windows
+    # build); httptools replaces the h11 parser with no endpoint changes
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="httptools",
+        log_level="warning",
+        access_log=False
+    )
@@ -4,49 +4,60 @@ Test runner script for Open Hardware Monitor Dashboard backend tests.
 This script provides an easy way to run different types of tests.
 """
 
+import os
 import subprocess
 import sys
-import os
+from importlib.metadata import distributions
 from pathlib import Path
 
-def run_command(command, description):
-    """Run a command and handle errors gracefully"""
-    print(f"\n{'='*60}")
-    print(f"Running: {description}")
-    print(f"Command: {command}")
-    print('='*60)
-    
-    try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print("✅ SUCCESS")
-        if result.stdout:
-            print("Output:")
-            print(result.stdout)
+# Skip pytest's entry-point plugin autoload (seconds of imports per run);
+# each invocation names the plugins it actually needs with -p
+_TEST_ENV = {
+    **os.environ,
+    "PYTHONDONTWRITEBYTECODE": "1",
+    "PYTEST_DISABLE_PLUGIN_AUTOLOAD": "1",
+}
+
+def run_command(args, description):
+    """Run a command (argv list) and stream its output as it arrives"""
+    # One buffered write per banner instead of a print (and stdout lock)
+    # per line
+    sys.stdout.write(
+        f"\n{'='*60}\nRunning: {description}\nCommand: {' '.join(args)}\n{'='*60}\n"
+    )
+    sys.stdout.flush()
+
+    # No shell: exec the argv directly, and stream the merged output
+    # line by line instead of buffering a whole pytest log in memory
+    process = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        env=_TEST_ENV
+    )
+    for line in process.stdout:
+        print(line, end="")
+    returncode = process.wait()
+
+    if returncode == 0:
+        sys.stdout.write("✅ SUCCESS\n")
         return True
-    except subprocess.CalledProcessError as e:
-        print("❌ FAILED")
-        print(f"Exit code: {e.returncode}")
-        if e.stdout:
-            print("STDOUT:")
-            print(e.stdout)
-        if e.stderr:
-            print("STDERR:")
-            print(e.stderr)
-        return False
+    sys.stdout.write(f"❌ FAILED\nExit code: {returncode}\n")
+    return False
 
 def check_dependencies():
     """Check if required testing dependencies are installed"""
     print("🔍 Checking testing dependencies...")
     
-    required_packages = ['pytest', 'pytest-cov', 'pytest-mock']
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing_packages.append(package)
-    
+    required_packages = ['pytest', 'pytest-cov', 'pytest-mock', 'pytest-xdist']
+
+    # Query installed distribution metadata instead of importing each
+    # package; importing pytest just to probe for it costs seconds
+    installed = {dist.metadata['Name'].lower() for dist in distributions()}
+    missing_packages = [p for p in required_packages if p.lower() not in installed]
+
     if missing_packages:
         print(f"❌ Missing packages: {', '.join(missing_packages)}")
         print("Install with: python -m pip install " + " ".join(missing_packages))
@@ -55,63 +66,106 @@ def check_dependencies():
     print("✅ All testing dependencies are installed")
     return True
 
+# Collected (nodeid, markers) pairs, filled once per process so the
+# unit/integration/all groups don't each re-collect and re-import tests/
+_collected_items = None
+
+def _collect():
+    """Collect test nodeids and their markers once, reusing on re-entry"""
+    global _collected_items
+    if _collected_items is None:
+        import pytest
+
+        class _Collector:
+            def __init__(self):
+                self.items = []
+
+            def pytest_collection_finish(self, session):
+                self.items = [
+                    (item.nodeid, {mark.name for mark in item.iter_markers()})
+                    for item in session.items
+                ]
+
+        collector = _Collector()
+        pytest.main(
+            ["--collect-only", "-q", "-p", "no:cacheprovider", "tests/"],
+            plugins=[collector]
+        )
+        _collected_items = collector.items
+    return _collected_items
+
+def _run_group(nodeids, description):
+    """Run already-collected nodeids in-process (keeps the import cache)"""
+    import pytest
+
+    sys.stdout.write(f"\n{'='*60}\nRunning: {description}\n{'='*60}\n")
+    sys.stdout.flush()
+
+    if not nodeids:
+        sys.stdout.write("✅ SUCCESS (no matching tests)\n")
+        return True
+
+    code = pytest.main(["-v", "--tb=short", "-p", "no:cacheprovider", *nodeids])
+    if code == 0:
+        sys.stdout.write("✅ SUCCESS\n")
+        return True
+    sys.stdout.write(f"❌ FAILED\nExit code: {code}\n")
+    return False
+
 def run_unit_tests():
     """Run unit tests"""
-    return run_command(
-        "python -m pytest tests/ -v --tb=short -m 'not integration and not slow'",
+    return _run_group(
+        [nid for nid, marks in _collect() if not marks & {'integration', 'slow'}],
         "Unit Tests"
     )
 
 def run_integration_tests():
     """Run integration tests"""
-    return run_command(
-        "python -m pytest tests/ -v --tb=short -m integration",
+    return _run_group(
+        [nid for nid, marks in _collect() if 'integration' in marks],
         "Integration Tests"
     )
 
 def run_all_tests():
     """Run all tests"""
-    return run_command(
-        "python -m pytest tests/ -v --tb=short",
-        "All Tests"
-    )
+    return _run_group([nid for nid, _ in _collect()], "All Tests")
 
 def run_tests_with_coverage():
     """Run tests with coverage report"""
     return run_command(
-        "python -m pytest tests/ -v --cov=app --cov-report=html --cov-report=term-missing",
+        [sys.executable, "-m", "pytest", "tests/", "-p", "xdist", "-p", "asyncio", "-p", "pytest_mock", "-p", "pytest_cov", "-p", "no:cacheprovider", "-n", "auto", "--dist=loadfile", "-v", "--cov=app", "--cov-context=test", "--cov-report=html", "--cov-report=term-missing"],
         "Tests with Coverage Report"
     )
 
 def run_specific_test_file(test_file):
     """Run tests from a specific file"""
-    if not os.path.exists(test_file):
+    if not Path(test_file).is_file():
         print(f"❌ Test file not found: {test_file}")
         return False
     
     return run_command(
-        f"python -m pytest {test_file} -v --tb=short",
+        [sys.executable, "-m", "pytest", test_file, "-p", "xdist", "-p", "asyncio", "-p", "pytest_mock", "-p", "no:cacheprovider", "-v", "--tb=short"],
         f"Specific Test File: {test_file}"
     )
 
 def run_insights_engine_tests():
     """Run insights engine tests specifically"""
     return run_command(
-        "python -m pytest tests/test_insights_engine.py -v --tb=short",
+        [sys.executable, "-m", "pytest", "tests/test_insights_engine.py", "-p", "xdist", "-p", "asyncio", "-p", "pytest_mock", "-p", "no:cacheprovider", "-v", "--tb=short"],
         "Insights Engine Tests"
     )
 
 def run_data_processor_tests():
     """Run data processor tests specifically"""
     return run_command(
-        "python -m pytest tests/test_data_processor.py -v --tb=short",
+        [sys.executable, "-m", "pytest", "tests/test_data_processor.py", "-p", "xdist", "-p", "asyncio", "-p", "pytest_mock", "-p", "no:cacheprovider", "-v", "--tb=short"],
         "Data Processor Tests"
     )
 
 def run_api_tests():
     """Run API endpoint tests specifically"""
     return run_command(
-        "python -m pytest tests/test_api_endpoints.py -v --tb=short",
+        [sys.executable, "-m", "pytest", "tests/test_api_endpoints.py", "-p", "xdist", "-p", "asyncio", "-p", "pytest_mock", "-p", "no:cacheprovider", "-v", "--tb=short"],
         "API Endpoint Tests"
     )
 
@@ -121,9 +175,10 @@ def main():
     print("=" * 60)
     
     # Check if we're in the right directory
-    if not os.path.exists('app') or not os.path.exists('tests'):
+    backend_dir = Path.cwd()
+    if not ((backend_dir / 'app').is_dir() and (backend_dir / 'tests').is_dir()):
         print("❌ Please run this script from the backend directory")
-        print("Current directory:", os.getcwd())
+        print("Current directory:", backend_dir)
         sys.exit(1)
     
     # Check dependencies
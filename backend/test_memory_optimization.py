@@ -5,6 +5,7 @@ Test script to verify memory optimizations in the data processor
 
 import sys
 import os
+from itertools import islice
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.services.data_processor import DataProcessor
@@ -25,7 +26,7 @@ def test_memory_optimization():
         # Get available dates
         print("📅 Getting available dates...")
         dates = processor.get_available_dates()
-        print(f"Found {len(dates)} available dates: {dates[:5]}...")
+        print(f"Found {len(dates)} available dates: {list(islice(dates, 5))}...")
         
         if not dates:
             print("❌ No dates found")
@@ -67,7 +68,7 @@ def test_memory_optimization():
         metrics = processor.extract_metrics(processed_df)
         print(f"✅ Extracted {len(metrics)} metrics")
         
-        for metric in metrics[:3]:  # Show first 3 metrics
+        for metric in islice(metrics, 3):  # Show first 3 metrics
             print(f"  {metric.metric_type}: {len(metric.values)} values")
         
         print("\n🎉 All tests passed! Memory optimization working correctly.")
@@ -0,0 +1,47 @@
+"""Shared fixtures for the backend test suite"""
+
+import sys
+import os
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport, Limits
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Shared sync client; the app lifespan runs once for the session
+
+    The base URL carries the /api/v1 prefix so tests address routes the
+    same way the frontend does.
+    """
+    with TestClient(app, base_url="http://test/api/v1") as test_client:
+        # Warm-up: force the lazy OpenAPI schema build and route setup
+        # once so no individual test pays that first-request cost
+        test_client.get("http://test/openapi.json")
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client():
+    """Shared async client over ASGITransport, reused by every async test
+
+    ASGI calls never leave the process, so HTTP/2 negotiation, pooling
+    and timeouts are dead weight — configure the minimum.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://test/api/v1",
+        http2=False,
+        limits=Limits(max_connections=1, max_keepalive_connections=1),
+        timeout=None,
+    ) as ac:
+        # Same warm-up for the async client's worker (schema build is
+        # cached on the app, but the first worker to run pays it)
+        await ac.get("http://test/openapi.json")
+        yield ac
@@ -1,6 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
 import tempfile
@@ -9,16 +10,41 @@ from pathlib import Path
 from app.services.data_processor import DataProcessor
 from app.models.hardware_models import MetricType, TimeSeriesData, HardwareMetric
 
+@dataclass(frozen=True, slots=True)
+class _TestSettings:
+    """Plain constant settings: attribute reads skip Mock's __getattr__"""
+    data_directory: str = "test_data"
+    max_csv_size_mb: int = 100
+    max_rows_per_file: int = 100000
+    chunk_size: int = 10000
+    max_data_points_per_request: int = 50000
+    enable_data_sampling: bool = True
+    sampling_ratio: float = 0.1
+
+
 @pytest.fixture
-def data_processor():
+def data_processor(monkeypatch):
     """Create a DataProcessor instance for testing"""
-    with patch('app.services.data_processor.settings') as mock_settings:
-        mock_settings.data_directory = "test_data"
-        mock_settings.max_csv_size_mb = 100
-        mock_settings.max_rows_per_file = 100000
-        mock_settings.chunk_size = 10000
-        processor = DataProcessor()
-        return processor
+    monkeypatch.setattr('app.services.data_processor.settings', _TestSettings())
+    return DataProcessor()
+
+@pytest.fixture(scope='module')
+def sample_data_dir(tmp_path_factory):
+    """Directory of canned logs shared by the period/system-info tests
+
+    Real files let those tests run the full load/process path with a
+    single attribute override instead of nested patch.object blocks.
+    """
+    data_dir = tmp_path_factory.mktemp('sample_logs')
+    csv_content = (
+        "Time,CPU Total,Memory,GPU Core\n"
+        "08/20/2025 00:00:03,3.125,43.7650833,49\n"
+        "08/20/2025 00:00:08,10.9375,43.7798424,47\n"
+    )
+    for date in ('2024-01-15', '2024-01-16', '2024-01-17', '2024-01-18'):
+        (data_dir / f"OpenHardwareMonitorLog-{date}.csv").write_text(csv_content)
+    return data_dir
+
 
 @pytest.fixture
 def temp_csv_file():
@@ -50,26 +76,30 @@ class TestDataProcessor:
     
     def test_get_available_dates(self, data_processor):
         """Test available dates detection from CSV files"""
-        # Mock the glob.glob to return mock files
-        mock_files = [
-            'test_data/OpenHardwareMonitorLog-2024-01-15.csv',
-            'test_data/OpenHardwareMonitorLog-2024-01-16.csv',
-            'test_data/OpenHardwareMonitorLog-2024-01-17.csv',
-            'test_data/other_file.txt',
-            'test_data/2024-01-18.csv'  # Alternative format
+        temp_dir = tempfile.mkdtemp()
+        filenames = [
+            'OpenHardwareMonitorLog-2024-01-15.csv',
+            'OpenHardwareMonitorLog-2024-01-16.csv',
+            'OpenHardwareMonitorLog-2024-01-17.csv',
+            'other_file.txt',
+            '2024-01-18.csv'  # Alternative format
         ]
+        for name in filenames:
+            (Path(temp_dir) / name).touch()
 
-        with patch('glob.glob') as mock_glob:
-            mock_glob.return_value = mock_files
-
-            dates = data_processor.get_available_dates()
+        try:
+            with patch.object(data_processor, 'data_directory', Path(temp_dir)):
+                dates = data_processor.get_available_dates()
 
-            # Should extract dates from CSV files
-            assert '2024-01-15' in dates
-            assert '2024-01-16' in dates
-            assert '2024-01-17' in dates
-            assert '2024-01-18' in dates
-            assert len(dates) == 4
+                # Should extract dates from CSV files
+                assert '2024-01-15' in dates
+                assert '2024-01-16' in dates
+                assert '2024-01-17' in dates
+                assert '2024-01-18' in dates
+                assert len(dates) == 4
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir)
     
     def test_load_csv_data_success(self, data_processor, temp_csv_file):
         """Test successful CSV loading"""
@@ -97,11 +127,9 @@ class TestDataProcessor:
     
     def test_load_csv_data_file_not_found(self, data_processor):
         """Test CSV loading when file doesn't exist"""
-        with patch('os.path.exists') as mock_exists:
-            mock_exists.return_value = False
-            
+        with patch('app.services.data_processor.os.stat', side_effect=FileNotFoundError):
             df = data_processor.load_csv_data('2024-01-15')
-            
+
             assert df.empty
     
     def test_process_csv_data(self, data_processor):
@@ -127,10 +155,11 @@ class TestDataProcessor:
         assert processed_df['timestamp'].dtype == 'datetime64[ns]'
         assert not processed_df['timestamp'].isna().any()
 
-        # Check numeric conversion
-        assert processed_df['CPU Core #1'].dtype in ['float64', 'int64']
-        assert processed_df['Memory'].dtype in ['float64', 'int64']
-        assert processed_df['GPU Core'].dtype in ['float64', 'int64']
+        # Check numeric conversion (narrow dtypes from downcasting are fine)
+        numeric_dtypes = ['float64', 'float32', 'int64', 'int32', 'int16', 'int8']
+        assert processed_df['CPU Core #1'].dtype in numeric_dtypes
+        assert processed_df['Memory'].dtype in numeric_dtypes
+        assert processed_df['GPU Core'].dtype in numeric_dtypes
     
     def test_process_csv_data_with_duplicates(self, data_processor):
         """Test CSV processing with duplicate column names"""
@@ -151,39 +180,23 @@ class TestDataProcessor:
         assert 'GPU Core' in processed_df.columns
         assert 'GPU Core.1' in processed_df.columns
     
-    def test_get_metrics_for_period(self, data_processor):
+    def test_get_metrics_for_period(self, data_processor, sample_data_dir, monkeypatch):
         """Test metrics extraction for a specific period"""
-        # Mock available dates
-        with patch.object(data_processor, 'get_available_dates') as mock_dates:
-            mock_dates.return_value = ['2024-01-15', '2024-01-16', '2024-01-17']
-            
-            # Mock CSV loading for each date
-            mock_df = pd.DataFrame({
-                'timestamp': pd.to_datetime(['08/20/2025 00:00:03', '08/20/2025 00:00:08']),
-                'CPU Total': [3.125, 10.9375],
-                'Memory': [43.7650833, 43.7798424],
-                'GPU Core': [49, 47]
-            })
-            
-            with patch.object(data_processor, 'load_csv_data') as mock_load:
-                mock_load.return_value = mock_df
-                
-                with patch.object(data_processor, 'process_csv_data') as mock_process:
-                    mock_process.return_value = mock_df
-                    
-                    metrics = data_processor.get_metrics_for_period(
-                        '2024-01-15', '2024-01-17', [MetricType.CPU_USAGE, MetricType.MEMORY_USAGE]
-                    )
-                    
-                    assert len(metrics) > 0
-                    
-                    # Check that metrics have the expected structure
-                    for metric in metrics:
-                        assert hasattr(metric, 'timestamps')
-                        assert hasattr(metric, 'values')
-                        assert hasattr(metric, 'metric_type')
-                        assert hasattr(metric, 'component')
-                        assert hasattr(metric, 'unit')
+        monkeypatch.setattr(data_processor, 'data_directory', sample_data_dir)
+
+        metrics = data_processor.get_metrics_for_period(
+            '2024-01-15', '2024-01-17', [MetricType.CPU_USAGE, MetricType.MEMORY_USAGE]
+        )
+
+        assert len(metrics) > 0
+
+        # Check that metrics have the expected structure
+        for metric in metrics:
+            assert hasattr(metric, 'timestamps')
+            assert hasattr(metric, 'values')
+            assert hasattr(metric, 'metric_type')
+            assert hasattr(metric, 'component')
+            assert hasattr(metric, 'unit')
     
     def test_get_metrics_for_period_no_data(self, data_processor):
         """Test metrics extraction when no data is available"""
@@ -196,32 +209,19 @@ class TestDataProcessor:
             
             assert len(metrics) == 0
     
-    def test_get_metrics_for_period_date_filtering(self, data_processor):
+    def test_get_metrics_for_period_date_filtering(self, data_processor, sample_data_dir, monkeypatch):
         """Test that metrics are properly filtered by date range"""
-        # Mock available dates
-        with patch.object(data_processor, 'get_available_dates') as mock_dates:
-            mock_dates.return_value = ['2024-01-15', '2024-01-16', '2024-01-17', '2024-01-18']
-            
-            # Mock CSV loading
-            mock_df = pd.DataFrame({
-                'timestamp': pd.to_datetime(['08/20/2025 00:00:03', '08/20/2025 00:00:08']),
-                'CPU Total': [3.125, 10.9375],
-                'Memory': [43.7650833, 43.7798424]
-            })
-            
-            with patch.object(data_processor, 'load_csv_data') as mock_load:
-                mock_load.return_value = mock_df
-                
-                with patch.object(data_processor, 'process_csv_data') as mock_process:
-                    mock_process.return_value = mock_df
-                    
-                    # Test inclusive end date
-                    metrics = data_processor.get_metrics_for_period(
-                        '2024-01-15', '2024-01-17', [MetricType.CPU_USAGE]
-                    )
-                    
-                    # Should include data from 2024-01-17 (inclusive)
-                    assert len(metrics) > 0
+        monkeypatch.setattr(data_processor, 'data_directory', sample_data_dir)
+
+        # Test inclusive end date
+        metrics = data_processor.get_metrics_for_period(
+            '2024-01-15', '2024-01-17', [MetricType.CPU_USAGE]
+        )
+
+        # Should include data from 2024-01-17 (inclusive) and exclude
+        # 2024-01-18: two rows per log, three logs in range
+        assert len(metrics) > 0
+        assert len(metrics[0].values) == 6
     
     def test_extract_metrics(self, data_processor):
         """Test metric extraction from processed DataFrame"""
@@ -242,7 +242,7 @@ class TestDataProcessor:
         assert cpu_metric.component == 'CPU Total'
         assert cpu_metric.unit == '%'
         assert len(cpu_metric.values) == 3
-        assert cpu_metric.values == [3.125, 10.9375, 15.625]
+        assert cpu_metric.values.tolist() == [3.125, 10.9375, 15.625]
         
         # Check memory usage metric
         memory_metric = next(m for m in metrics if m.metric_type == MetricType.MEMORY_USAGE)
@@ -250,6 +250,26 @@ class TestDataProcessor:
         assert memory_metric.unit == '%'
         assert len(memory_metric.values) == 3
     
+    def test_extract_metrics_downsamples_large_series(self, data_processor, monkeypatch):
+        """Series above the response limit are bucket-averaged down"""
+        monkeypatch.setattr(
+            'app.services.data_processor.settings',
+            _TestSettings(max_data_points_per_request=100)
+        )
+        n = 5000
+        processed_df = pd.DataFrame({
+            'timestamp': pd.date_range('2024-01-15', periods=n, freq='1s'),
+            'CPU Total': np.linspace(0.0, 100.0, n),
+        })
+
+        metrics = data_processor.extract_metrics(processed_df, [MetricType.CPU_USAGE])
+
+        assert len(metrics) == 1
+        assert len(metrics[0].values) <= 100
+        assert len(metrics[0].timestamps) == len(metrics[0].values)
+        # Bucket means of an increasing ramp stay increasing
+        assert np.all(np.diff(metrics[0].values) > 0)
+
     def test_extract_metrics_with_missing_columns(self, data_processor):
         """Test metric extraction when some columns are missing"""
         # Create DataFrame with only some expected columns
@@ -265,34 +285,18 @@ class TestDataProcessor:
         assert len(metrics) == 1
         assert metrics[0].metric_type == MetricType.CPU_USAGE
     
-    def test_get_system_info(self, data_processor):
+    def test_get_system_info(self, data_processor, sample_data_dir, monkeypatch):
         """Test system information extraction"""
-        # Mock available dates
-        with patch.object(data_processor, 'get_available_dates') as mock_dates:
-            mock_dates.return_value = ['2024-01-15', '2024-01-16']
-            
-            # Mock CSV loading
-            mock_df = pd.DataFrame({
-                'Time': ['08/20/2025 00:00:03', '08/20/2025 00:00:08'],
-                'CPU Core #1': [3.125, 10.9375],
-                'Memory': [43.7650833, 43.7798424],
-                'GPU Core': [49, 47]
-            })
-            
-            with patch.object(data_processor, 'load_csv_data') as mock_load:
-                mock_load.return_value = mock_df
-                
-                with patch.object(data_processor, 'process_csv_data') as mock_process:
-                    mock_process.return_value = mock_df
-                    
-                    system_info = data_processor.get_system_info()
-                    
-                    assert system_info is not None
-                    assert 'total_files' in system_info
-                    assert 'date_range' in system_info
-                    assert 'monitoring_duration' in system_info
-                    assert 'data_points' in system_info
-                    assert system_info['total_files'] == 2
+        monkeypatch.setattr(data_processor, 'data_directory', sample_data_dir)
+
+        system_info = data_processor.get_system_info()
+
+        assert system_info is not None
+        assert 'total_files' in system_info
+        assert 'date_range' in system_info
+        assert 'monitoring_duration' in system_info
+        assert 'data_points' in system_info
+        assert system_info['total_files'] == 4
     
     def test_memory_optimization_settings(self, data_processor):
         """Test memory optimization configuration"""
@@ -325,17 +329,16 @@ class TestDataProcessor:
     
     def test_large_file_handling(self, data_processor):
         """Test handling of large CSV files"""
-        # Create a large CSV file with the expected filename format
-        large_csv_content = "Time,CPU,Memory\n"
-        for i in range(10000):  # 10k rows
-            large_csv_content += f"08/20/2025 00:{i:02d}:00,{i % 100},{50 + i % 30}\n"
-        
-        # Create the file with the expected name
+        # Create a large CSV file (10k rows) with the expected filename
+        # format; a single join avoids quadratic string concatenation
+        large_csv_content = "Time,CPU,Memory\n" + "\n".join(
+            f"08/20/2025 00:{i:02d}:00,{i % 100},{50 + i % 30}"
+            for i in range(10000)
+        ) + "\n"
+
         temp_dir = tempfile.mkdtemp()
         temp_file = Path(temp_dir) / "OpenHardwareMonitorLog-2024-01-15.csv"
-        
-        with open(temp_file, 'w') as f:
-            f.write(large_csv_content)
+        temp_file.write_text(large_csv_content)
         
         try:
             # Mock the data directory path
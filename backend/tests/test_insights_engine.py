@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+from collections import namedtuple
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
 from app.services.insights_engine import InsightsEngine
@@ -8,6 +9,14 @@ from app.models.hardware_models import (
 )
 
 
+def _ts_range(n, step_min=1, base=None):
+    """n datetimes at step_min-minute intervals, generated as one
+    datetime64 range instead of n datetime/timedelta allocations"""
+    start = np.datetime64('now') if base is None else np.datetime64(base)
+    return (start + np.arange(n) * np.timedelta64(step_min, 'm')).astype(
+        'datetime64[us]').tolist()
+
+
 class TestInsightsEngine:
     """Test suite for the enhanced InsightsEngine with anomaly detection"""
     
@@ -16,43 +25,44 @@ class TestInsightsEngine:
         """Create a fresh InsightsEngine instance for each test"""
         return InsightsEngine()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_temperature_data(self):
         """Create sample temperature data with some anomalies"""
-        # Create timestamps for a day
-        base_time = datetime(2024, 1, 15, 0, 0, 0)
-        timestamps = [base_time + timedelta(minutes=i*5) for i in range(288)]  # 24 hours, 5-min intervals
-        
         # Create normal temperature values (60-75°C) with some anomalies
-        np.random.seed(42)  # For reproducible tests
-        normal_temps = np.random.normal(67.5, 5, 280)  # 280 normal values
+        rng = np.random.default_rng(42)  # For reproducible tests
+        normal_temps = rng.normal(67.5, 5, 280)  # 280 normal values
         normal_temps = np.clip(normal_temps, 60, 75)
-        
-        # Add some anomalies
-        anomalies = [95.0, 98.0, 45.0, 100.0, 35.0]  # High and low anomalies
-        anomaly_positions = [50, 100, 150, 200, 250]
-        
-        values = list(normal_temps)
-        for pos, anomaly in zip(anomaly_positions, anomalies):
-            values.insert(pos, anomaly)
-        
+
+        # Splice in high and low anomalies with one allocation instead of
+        # repeated list.insert shifts
+        anomalies = np.array([95.0, 98.0, 45.0, 100.0, 35.0])
+        anomaly_positions = np.array([50, 100, 150, 200, 250])
+        values = np.insert(normal_temps, anomaly_positions, anomalies)
+
+        # Timestamps for a day at 5-minute intervals, generated as one
+        # datetime64 range
+        base_time = datetime(2024, 1, 15, 0, 0, 0)
+        timestamps = (
+            np.datetime64(base_time) + np.arange(len(values)) * np.timedelta64(5, 'm')
+        ).astype('datetime64[us]').tolist()
+
         return TimeSeriesData(
-            timestamps=timestamps[:len(values)],
+            timestamps=timestamps,
             values=values,
             metric_type=MetricType.CPU_TEMP,
             component="cpu",
             unit="°C"
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_usage_data(self):
         """Create sample CPU usage data"""
         base_time = datetime(2024, 1, 15, 0, 0, 0)
-        timestamps = [base_time + timedelta(minutes=i*5) for i in range(100)]
+        timestamps = _ts_range(100, step_min=5, base=base_time)
         
         # Normal usage pattern with some spikes
-        np.random.seed(42)
-        values = np.random.normal(45, 15, 100)
+        rng = np.random.default_rng(42)
+        values = rng.normal(45, 15, 100)
         values = np.clip(values, 5, 95)
         
         # Add some high usage spikes
@@ -67,6 +77,18 @@ class TestInsightsEngine:
             unit="%"
         )
     
+    @pytest.fixture(scope="module")
+    def precomputed_baseline(self, sample_temperature_data):
+        """Values, timestamps and baseline stats computed once per module
+
+        The insight-builder tests all summarize the same 285-point array;
+        sharing the computation keeps each test to its own assertions.
+        """
+        values = sample_temperature_data.values  # already a numpy array at ingest
+        timestamps = sample_temperature_data.timestamps
+        baseline_stats = InsightsEngine()._calculate_baseline_stats(values)
+        return values, timestamps, baseline_stats
+
     @pytest.fixture
     def mock_data_processor(self):
         """Mock DataProcessor for testing"""
@@ -109,54 +131,57 @@ class TestInsightsEngine:
         filtered = insights_engine._filter_data_to_period(test_data, start_dt, end_dt)
         
         assert len(filtered['values']) == 3
-        assert filtered['values'] == [20, 30, 40]
-        assert filtered['timestamps'] == [timestamps[1], timestamps[2], timestamps[3]]
+        assert filtered['values'].tolist() == [20, 30, 40]
+        assert filtered['timestamps'].astype('datetime64[us]').tolist() == [
+            timestamps[1], timestamps[2], timestamps[3]
+        ]
     
-    def test_anomaly_detection_z_score(self, insights_engine, sample_temperature_data):
-        """Test Z-score based anomaly detection"""
-        values = np.array(sample_temperature_data.values)
-        timestamps = sample_temperature_data.timestamps
-        
-        anomalies = insights_engine._detect_anomalies(values, timestamps, MetricType.CPU_TEMP)
-        
+    @pytest.mark.parametrize("method", ["z", "iqr", "iqr-streaming", "threshold"])
+    def test_anomaly_detection(self, insights_engine, sample_temperature_data, method):
+        """Test each anomaly-detection method over one shared body"""
+        if method == "z":
+            # Shared fixture with spliced extreme values
+            values = sample_temperature_data.values  # already a numpy array at ingest
+            timestamps = sample_temperature_data.timestamps
+            metric_type = MetricType.CPU_TEMP
+        elif method.startswith("iqr"):
+            # Clear outliers beyond the IQR fences; the streaming variant
+            # judges each arriving value against the preceding window
+            if method == "iqr-streaming":
+                insights_engine.anomaly_config.streaming = True
+            values = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 100, 200])
+            timestamps = _ts_range(len(values))
+            metric_type = MetricType.CPU_USAGE
+        else:
+            # Temperatures reaching the critical threshold (default 100)
+            values = np.array([60, 65, 70, 75, 80, 85, 90, 95, 100, 105, 102])
+            timestamps = _ts_range(len(values))
+            metric_type = MetricType.CPU_TEMP
+
+        anomalies = insights_engine._detect_anomalies(values, timestamps, metric_type)
+
         # Should detect some anomalies
         assert len(anomalies) > 0
-        
+
         # Check that anomalies have correct structure
         for anomaly in anomalies:
             assert isinstance(anomaly, AnomalyEvent)
             assert anomaly.timestamp in timestamps
-            assert anomaly.value in values
             assert anomaly.severity in ['minor', 'moderate', 'severe']
             assert len(anomaly.expected_range) == 2
             assert anomaly.expected_range[0] < anomaly.expected_range[1]
-    
-    def test_anomaly_detection_iqr(self, insights_engine):
-        """Test IQR based anomaly detection"""
-        # Create data with clear outliers
-        values = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 100, 200])
-        timestamps = [datetime.now() + timedelta(minutes=i) for i in range(len(values))]
-        
-        anomalies = insights_engine._detect_anomalies(values, timestamps, MetricType.CPU_USAGE)
-        
-        # Should detect the extreme outliers (100, 200)
-        assert len(anomalies) >= 2
-        
+
+        # One vectorized membership check instead of an O(n) scan per event
         anomaly_values = [a.value for a in anomalies]
-        assert 100 in anomaly_values
-        assert 200 in anomaly_values
-    
-    def test_anomaly_detection_threshold(self, insights_engine):
-        """Test threshold-based anomaly detection for temperatures"""
-        # Create data with values above critical threshold
-        values = np.array([60, 70, 80, 90, 95, 100, 105])
-        timestamps = [datetime.now() + timedelta(minutes=i) for i in range(len(values))]
-        
-        anomalies = insights_engine._detect_anomalies(values, timestamps, MetricType.CPU_TEMP)
-        
-        # Should detect values above critical threshold (default 100)
-        critical_anomalies = [a for a in anomalies if a.value >= 100]
-        assert len(critical_anomalies) >= 2  # 100, 105
+        assert np.isin(np.asarray(anomaly_values), values.astype(np.float64)).all()
+        if method.startswith("iqr"):
+            # Both extreme outliers must be flagged
+            assert 100 in anomaly_values
+            assert 200 in anomaly_values
+        elif method == "threshold":
+            # Values at or above the critical threshold must be flagged
+            critical_anomalies = [a for a in anomalies if a.value >= 100]
+            assert len(critical_anomalies) >= 2  # 100, 105, 102
     
     def test_remove_anomalies(self, insights_engine):
         """Test anomaly removal from dataset"""
@@ -167,22 +192,23 @@ class TestInsightsEngine:
                 value=100,
                 severity='moderate',
                 description='Test anomaly',
-                expected_range=(1, 10)
+                expected_range=(1, 10),
+                index=3
             ),
             AnomalyEvent(
                 timestamp=datetime.now(),
                 value=200,
                 severity='severe',
                 description='Test anomaly',
-                expected_range=(1, 10)
+                expected_range=(1, 10),
+                index=6
             )
         ]
         
         clean_values = insights_engine._remove_anomalies(values, anomalies)
         
-        # Should remove the anomalous values
-        assert 100 not in clean_values
-        assert 200 not in clean_values
+        # Should remove the anomalous values (one vectorized membership check)
+        assert not np.isin([100, 200], clean_values).any()
         assert len(clean_values) == len(values) - 2
     
     def test_calculate_baseline_stats(self, insights_engine):
@@ -208,14 +234,13 @@ class TestInsightsEngine:
         assert stats['q75'] == 7.75
         assert stats['iqr'] == 4.5
     
-    def test_create_anomaly_insight(self, insights_engine, sample_temperature_data):
+    def test_create_anomaly_insight(self, insights_engine, sample_temperature_data,
+                                    precomputed_baseline):
         """Test anomaly insight creation"""
-        values = np.array(sample_temperature_data.values)
-        timestamps = sample_temperature_data.timestamps
-        
+        values, timestamps, baseline_stats = precomputed_baseline
+
         anomalies = insights_engine._detect_anomalies(values, timestamps, MetricType.CPU_TEMP)
-        baseline_stats = insights_engine._calculate_baseline_stats(values)
-        
+
         start_dt = datetime(2024, 1, 15, 0, 0, 0)
         end_dt = datetime(2024, 1, 16, 0, 0, 0)
         
@@ -233,12 +258,11 @@ class TestInsightsEngine:
         assert insight.period_end == end_dt
         assert insight.baseline_stats == baseline_stats
     
-    def test_generate_threshold_insights(self, insights_engine, sample_temperature_data):
+    def test_generate_threshold_insights(self, insights_engine, sample_temperature_data,
+                                         precomputed_baseline):
         """Test threshold-based insight generation"""
-        values = np.array(sample_temperature_data.values)
-        timestamps = sample_temperature_data.timestamps
-        baseline_stats = insights_engine._calculate_baseline_stats(values)
-        
+        values, timestamps, baseline_stats = precomputed_baseline
+
         start_dt = datetime(2024, 1, 15, 0, 0, 0)
         end_dt = datetime(2024, 1, 16, 0, 0, 0)
         
@@ -256,12 +280,11 @@ class TestInsightsEngine:
             assert insight.period_end == end_dt
             assert insight.baseline_stats == baseline_stats
     
-    def test_generate_performance_insights(self, insights_engine, sample_temperature_data):
+    def test_generate_performance_insights(self, insights_engine, sample_temperature_data,
+                                           precomputed_baseline):
         """Test performance insight generation"""
-        values = np.array(sample_temperature_data.values)
-        timestamps = sample_temperature_data.timestamps
-        baseline_stats = insights_engine._calculate_baseline_stats(values)
-        
+        values, timestamps, baseline_stats = precomputed_baseline
+
         start_dt = datetime(2024, 1, 15, 0, 0, 0)
         end_dt = datetime(2024, 1, 16, 0, 0, 0)
         
@@ -279,7 +302,7 @@ class TestInsightsEngine:
         """Test cross-metric insight generation"""
         # Create CPU and GPU temperature data
         base_time = datetime(2024, 1, 15, 12, 0, 0)
-        timestamps = [base_time + timedelta(minutes=i*5) for i in range(100)]
+        timestamps = _ts_range(100, step_min=5, base=base_time)
         
         cpu_temps = TimeSeriesData(
             timestamps=timestamps,
@@ -316,7 +339,7 @@ class TestInsightsEngine:
         """Test trend analysis and insight generation"""
         # Create data with clear increasing trend
         base_time = datetime(2024, 1, 15, 12, 0, 0)
-        timestamps = [base_time + timedelta(minutes=i*5) for i in range(100)]
+        timestamps = _ts_range(100, step_min=5, base=base_time)
         
         # Increasing temperature trend
         values = [60 + i * 0.2 for i in range(100)]  # 60°C to 80°C
@@ -366,13 +389,15 @@ class TestInsightsEngine:
         start_date = "2024-01-15"
         end_date = "2024-01-16"
         
-        # Mock the analyze_period method
+        # Stub the analyzed insights with namedtuples; plain C-level
+        # attribute access instead of Mock's __getattr__ dispatch
+        Insight = namedtuple('Insight', 'level anomaly_count recommendations')
         with patch.object(insights_engine, 'analyze_period') as mock_analyze:
             mock_insights = [
-                Mock(level=InsightLevel.CRITICAL, anomaly_count=2),
-                Mock(level=InsightLevel.WARNING, anomaly_count=1),
-                Mock(level=InsightLevel.SUCCESS, anomaly_count=0),
-                Mock(level=InsightLevel.INFO, anomaly_count=0),
+                Insight(InsightLevel.CRITICAL, 2, []),
+                Insight(InsightLevel.WARNING, 1, []),
+                Insight(InsightLevel.SUCCESS, 0, []),
+                Insight(InsightLevel.INFO, 0, []),
             ]
             mock_analyze.return_value = mock_insights
             
@@ -390,7 +415,7 @@ class TestInsightsEngine:
         """Test handling of insufficient data for analysis"""
         # Create data with too few points
         insufficient_data = TimeSeriesData(
-            timestamps=[datetime.now() + timedelta(minutes=i) for i in range(5)],
+            timestamps=_ts_range(5),
             values=[1, 2, 3, 4, 5],
             metric_type=MetricType.CPU_TEMP,
             component="cpu",
@@ -411,7 +436,7 @@ class TestInsightsEngine:
         """Test reliability warning when too many anomalies detected"""
         # Create data with mostly anomalies
         base_time = datetime(2024, 1, 15, 12, 0, 0)
-        timestamps = [base_time + timedelta(minutes=i*5) for i in range(20)]
+        timestamps = _ts_range(20, step_min=5, base=base_time)
         
         # Create mostly anomalous values
         values = [100] * 15 + [60, 61, 62, 63, 64]  # 15 high temps, 5 normal
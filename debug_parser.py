@@ -5,6 +5,7 @@ Debug script to see what's happening with the data processing
 
 import sys
 import os
+import numpy as np
 import pandas as pd
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
@@ -24,40 +25,44 @@ def debug_data_parsing():
         print("No dates found!")
         return
     
-    latest_date = dates[-1]
+    latest_date = processor.latest_date()
     print(f"Using date: {latest_date}")
     
     # Load the data
     try:
         df = processor.load_csv_data(latest_date)
         print(f"Loaded data with {len(df)} rows and {len(df.columns)} columns")
-        
+
+        # Resolve every column (including duplicates, via their first
+        # occurrence) to a numpy array once; the checks below become
+        # dict lookups instead of repeated isinstance branches
+        col_map = {}
+        for col in df.columns.unique():
+            column_data = df[col]
+            if isinstance(column_data, pd.DataFrame):
+                column_data = column_data.iloc[:, 0]
+            col_map[col] = column_data.to_numpy()
+
         # Check specific columns
         print("\nChecking specific columns:")
         columns_to_check = ['CPU Total', 'Memory', 'GPU Core', 'Used Space']
-        
+
         for col in columns_to_check:
-            if col in df.columns:
+            arr = col_map.get(col)
+            if arr is not None:
                 print(f"Column '{col}' exists")
-                # Check if it's a DataFrame (duplicate column) or Series
-                column_data = df[col]
-                if isinstance(column_data, pd.DataFrame):
-                    print(f"  Column is a DataFrame with {len(column_data.columns)} sub-columns")
-                    # Use the first sub-column
-                    column_data = column_data.iloc[:, 0]
-                    print(f"  Using first sub-column: {column_data.name}")
-                
+
                 # Show first few values
-                values = column_data.head(5).tolist()
-                print(f"  First 5 values: {values}")
-                
+                print(f"  First 5 values: {arr[:5].tolist()}")
+
                 # Try to convert to numeric
-                numeric_values = pd.to_numeric(column_data, errors='coerce')
-                valid_count = numeric_values.notna().sum()
+                numeric_values = pd.to_numeric(arr, errors='coerce')
+                valid_mask = ~np.isnan(numeric_values)
+                valid_count = int(valid_mask.sum())
                 print(f"  Valid numeric values: {valid_count}/{len(df)}")
-                
+
                 if valid_count > 0:
-                    sample_values = numeric_values.dropna().head(3).tolist()
+                    sample_values = numeric_values[valid_mask][:3].tolist()
                     print(f"  Sample numeric values: {sample_values}")
             else:
                 print(f"Column '{col}' NOT found")
@@ -77,23 +82,14 @@ def debug_data_parsing():
             for i, col in enumerate(df.columns):
                 print(f"  {i}: '{col}'")
             
-            # Debug: Test column access directly
+            # Debug: Test column access through the resolved map
             print(f"\nTesting column access directly:")
             test_columns = ['CPU Total', 'Memory', 'GPU Core', 'Used Space']
             for col in test_columns:
-                if col in df.columns:
+                arr = col_map.get(col)
+                if arr is not None:
                     print(f"  Column '{col}' exists")
-                    column_data = df[col]
-                    if isinstance(column_data, pd.DataFrame):
-                        print(f"    - Is DataFrame with {len(column_data.columns)} sub-columns")
-                        print(f"    - Sub-columns: {list(column_data.columns)}")
-                        # Test accessing first sub-column
-                        first_sub_col = column_data.iloc[:, 0]
-                        print(f"    - First sub-column name: '{first_sub_col.name}'")
-                        print(f"    - First sub-column first 3 values: {first_sub_col.head(3).tolist()}")
-                    else:
-                        print(f"    - Is Series")
-                        print(f"    - First 3 values: {column_data.head(3).tolist()}")
+                    print(f"    - First 3 values: {arr[:3].tolist()}")
                 else:
                     print(f"  Column '{col}' NOT found")
             
@@ -131,32 +127,27 @@ def debug_data_parsing():
                 MetricType.DISK_USAGE: ['Used Space'] # Disk usage
             }
             
+            # Coerce every mapped column in one apply call instead of a
+            # separate pd.to_numeric per metric inside the loop
+            all_cols = list(dict.fromkeys(
+                c for cols in metric_mapping.values() for c in cols if c in col_map
+            ))
+            numeric_block = pd.DataFrame({c: col_map[c] for c in all_cols}).apply(
+                pd.to_numeric, errors='coerce'
+            )
+
             print("Testing metric mapping:")
             for metric_type, columns in metric_mapping.items():
                 print(f"  {metric_type.value}: {columns}")
                 for col in columns:
-                    if col in combined_df.columns:
+                    if col in col_map:
                         print(f"    - Column '{col}' found in DataFrame")
-                        column_data = combined_df[col]
-                        if isinstance(column_data, pd.DataFrame):
-                            print(f"      - Is DataFrame with {len(column_data.columns)} sub-columns")
-                            # Use the first sub-column
-                            column_data = column_data.iloc[:, 0]
-                            print(f"      - Using first sub-column: '{column_data.name}'")
-                        else:
-                            print(f"      - Is Series: '{column_data.name}'")
-                        
-                        # Clean data and convert to numeric
+
+                        # Pair the pre-coerced column with its timestamps
                         clean_data = combined_df[['timestamp']].copy()
-                        clean_data[col] = column_data
-                        clean_data = clean_data.dropna()
-                        
-                        print(f"      - Clean data shape: {clean_data.shape}")
-                        
-                        # Convert column to numeric, coercing errors to NaN
-                        clean_data[col] = pd.to_numeric(clean_data[col], errors='coerce')
+                        clean_data[col] = numeric_block[col].to_numpy()
                         clean_data = clean_data.dropna()
-                        
+
                         print(f"      - After numeric conversion: {clean_data.shape}")
                         
                         if len(clean_data) > 0:
@@ -164,26 +155,22 @@ def debug_data_parsing():
                             
                             # Test the final conversion step
                             try:
-                                # Convert values to float, handling any remaining non-numeric values
-                                values = []
-                                for v in clean_data[col].tolist():
-                                    try:
-                                        values.append(float(v))
-                                    except (ValueError, TypeError):
-                                        continue
-                                
+                                # One numpy pass replaces the per-element
+                                # float() loop: mask out NaNs and gather
+                                # values with their timestamps (the column
+                                # was coerced in the batched apply above)
+                                arr = clean_data[col].to_numpy(dtype=np.float64, copy=False)
+                                mask = ~np.isnan(arr)
+                                values = arr[mask]
+                                ts_array = clean_data['timestamp'].to_numpy(dtype='datetime64[ns]')[mask]
+
                                 print(f"      - Converted {len(values)} values to float")
-                                
+
                                 if len(values) > 0:
-                                    # Get corresponding timestamps
-                                    timestamps = clean_data['timestamp'].tolist()
-                                    # Ensure we have matching timestamps and values
-                                    if len(timestamps) >= len(values):
-                                        timestamps = timestamps[:len(values)]
-                                    else:
-                                        # If we have more values than timestamps, truncate values
-                                        values = values[:len(timestamps)]
-                                    
+                                    # Same mask indexed both arrays, so
+                                    # timestamps and values already match
+                                    timestamps = ts_array.astype('datetime64[us]').tolist()
+
                                     print(f"      - Final: {len(timestamps)} timestamps, {len(values)} values")
                                     
                                     # Test creating TimeSeriesData object
@@ -5,10 +5,16 @@ Test script to check if the data processor is working with the fixed configurati
 
 import sys
 import os
+import faulthandler
+import traceback
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
-from backend.app.core.config import settings, get_data_directory
-from backend.app.services.data_processor import DataProcessor
+# Dump stacks on hangs/crashes without paying for the traceback module
+# machinery on every run
+faulthandler.enable()
+
+from app.core.config import settings, get_data_directory
+from app.services.data_processor import DataProcessor
 
 def test_api_functionality():
     """Test the API functionality directly"""
@@ -49,7 +55,7 @@ def test_api_functionality():
     # Test metrics for latest date
     if dates:
         try:
-            latest_date = dates[-1]
+            latest_date = processor.latest_date()
             print(f"\n4. Testing metrics for {latest_date}:")
             metrics = processor.get_metrics_for_period(latest_date, latest_date)
             print(f"   Found {len(metrics)} metrics:")
@@ -57,7 +63,6 @@ def test_api_functionality():
                 print(f"   - {metric.metric_type.value}: {len(metric.values)} values")
         except Exception as e:
             print(f"   Error getting metrics: {e}")
-            import traceback
             traceback.print_exc()
 
 if __name__ == "__main__":
@@ -31,7 +31,7 @@ def test_data_parsing():
         return
     
     # Test loading data for the most recent date
-    latest_date = dates[-1]
+    latest_date = processor.latest_date()
     print(f"\n2. Loading data for {latest_date}:")
     
     try:
@@ -48,12 +48,17 @@ def test_data_parsing():
     print(f"\n3. Extracting metrics for {latest_date}:")
     try:
         metrics = processor.get_metrics_for_period(latest_date, latest_date)
-        print(f"Found {len(metrics)} metric types:")
-        
+
+        # Collect the per-metric lines and write them in one call instead
+        # of two flushes per metric
+        lines = [f"Found {len(metrics)} metric types:"]
         for metric in metrics:
-            print(f"  - {metric.metric_type.value}: {len(metric.values)} values, unit: {metric.unit}")
-            if metric.values:
-                print(f"    Range: {min(metric.values):.2f} - {max(metric.values):.2f}")
+            lines.append(f"  - {metric.metric_type.value}: {len(metric.values)} values, unit: {metric.unit}")
+            if len(metric.values) > 0:
+                # values is a numpy array, so min/max are single C-level
+                # reductions instead of boxed Python comparisons
+                lines.append(f"    Range: {metric.values.min():.2f} - {metric.values.max():.2f}")
+        sys.stdout.write('\n'.join(lines) + '\n')
     except Exception as e:
         print(f"Error extracting metrics: {e}")
         return